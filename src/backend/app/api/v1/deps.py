@@ -1,5 +1,9 @@
+from typing import Optional
+
 from fastapi import Request, HTTPException, status
 from fastapi.security import HTTPBearer
+from redis.asyncio import Redis
+
 from app.core.config import settings
 from app.utils.logger import get_logger
 
@@ -26,3 +30,8 @@ async def verify_api_key(request: Request):
 
     except ValueError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid authorization format")
+
+
+def get_redis(request: Request) -> Optional[Redis]:
+    """Redis client pooled on the app at startup, or None when Redis is not configured"""
+    return getattr(request.app.state, "redis", None)
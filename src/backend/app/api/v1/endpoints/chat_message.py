@@ -1,25 +1,36 @@
-from fastapi import APIRouter, Query
+import logging
+
+from fastapi import APIRouter, BackgroundTasks, Query
 from typing import List, Optional
 
 from app.services.chat.message import ChatMessageService
 from app.schemas.chat import ChatMessageCreate, ChatMessageResponse, BulkChatMessageCreate
 from app.tasks.chat import trigger_chat_workflow, trigger_suggestion_workflow
+from app.utils.logger import get_logger
 
 router = APIRouter(prefix="/messages", tags=["Chat Messages"])
+logger = get_logger(__name__)
 
 
 @router.post("", response_model=ChatMessageResponse)
-async def create_message(message_data: ChatMessageCreate):
-    print("Received message data:", message_data.model_dump_json())
+async def create_message(message_data: ChatMessageCreate, background_tasks: BackgroundTasks):
+    # Skip serializing the payload unless debug logging is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received message data: %s", message_data.model_dump_json())
     chat_message = ChatMessageService.create_chat_message(message_data)
 
     ai_enabled = message_data.config.ai_enabled
     suggestion_mode = message_data.config.suggestion_mode
 
+    # Enqueue the workflow after the response is sent so the broker round-trip isn't on the request path
     if ai_enabled and not suggestion_mode:
-        trigger_chat_workflow(message_id=str(chat_message.id), session_id=chat_message.session_id)
+        background_tasks.add_task(
+            trigger_chat_workflow, message_id=str(chat_message.id), session_id=chat_message.session_id
+        )
     elif not ai_enabled and suggestion_mode:
-        trigger_suggestion_workflow(message_id=str(chat_message.id), session_id=chat_message.session_id)
+        background_tasks.add_task(
+            trigger_suggestion_workflow, message_id=str(chat_message.id), session_id=chat_message.session_id
+        )
 
     return chat_message
 
@@ -37,8 +48,11 @@ async def update_message(message_id: str, message_data: ChatMessageCreate):
 
 
 @router.post("/bulk", response_model=List[ChatMessageResponse])
-async def create_bulk_messages(bulk_message_data: BulkChatMessageCreate):
+async def create_bulk_messages(bulk_message_data: BulkChatMessageCreate, background_tasks: BackgroundTasks):
     chat_message_bulk_create_response = ChatMessageService.create_bulk_chat_messages(bulk_message_data)
-    latest_message = max(chat_message_bulk_create_response, key=lambda x: x.created_at)
-    trigger_chat_workflow(message_id=str(latest_message.id), session_id=latest_message.session_id)
+    # Messages come back ordered by created_at
+    latest_message = chat_message_bulk_create_response[-1]
+    background_tasks.add_task(
+        trigger_chat_workflow, message_id=str(latest_message.id), session_id=latest_message.session_id
+    )
     return chat_message_bulk_create_response
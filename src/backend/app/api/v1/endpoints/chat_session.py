@@ -1,19 +1,220 @@
-import mongoengine as me
+import asyncio
+import base64
+import hashlib
+import json
+import re
+
+import orjson
+from mongoengine import Q
 from fastapi import HTTPException, Depends, APIRouter, Query
-from typing import Optional, Annotated
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
+from typing import List, Optional, Tuple, Annotated
 from datetime import datetime
 from bson import ObjectId
+from bson.errors import InvalidId
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
 
 from app.models.mongodb.chat_session import ChatSession
 from app.models.mongodb.chat_message import ChatMessage
 from app.models.mongodb.events.event import Event
 from app.schemas.chat_session import ChatSessionResponse, ChatSessionListResponse
-from app.api.v1.deps import verify_api_key
+from app.api.v1.deps import get_redis, verify_api_key
 from app.utils.logger import get_logger
 
 router = APIRouter(prefix="", tags=["Chat Sessions"])
 logger = get_logger(__name__)
 
+SESSION_CACHE_TTL_SECONDS = 60
+SESSION_COUNT_CACHE_TTL_SECONDS = 45
+
+OBJECT_ID_RE = re.compile(r"^[0-9a-fA-F]{24}$")
+
+# Full session identifiers (ObjectId or UUID) that are matched exactly instead of by prefix
+FULL_SESSION_ID_RE = re.compile(
+    r"^(?:[0-9a-fA-F]{24}|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})$"
+)
+
+# Fields read when building ChatSessionResponse; everything else is left out of the listing queries
+SESSION_LIST_FIELDS = (
+    "id",
+    "session_id",
+    "created_at",
+    "updated_at",
+    "active",
+    "client",
+    "client_channel",
+    "participants",
+    "has_handover",
+)
+
+
+def parse_object_id(value: str, name: str = "id") -> ObjectId:
+    """Parse an ObjectId from user input, rejecting malformed values with a 400 before any query runs."""
+    if not OBJECT_ID_RE.match(value):
+        raise HTTPException(status_code=400, detail=f"Invalid {name}")
+    return ObjectId(value)
+
+
+def session_id_filter(session_id: str) -> Q:
+    """
+    Build an index-friendly session_id filter. A full ObjectId/UUID matches that session and its
+    threads (session_id#thread), anything else matches as a case-sensitive prefix. Session ids are
+    stored as the client sent them, so a full id matches both as given and in its lowercase form,
+    each with its own anchored regex.
+    """
+    if not FULL_SESSION_ID_RE.match(session_id):
+        return Q(session_id__startswith=session_id)
+
+    session_q = Q(session_id=re.compile(f"^{re.escape(session_id)}(#|$)"))
+    if session_id != session_id.lower():
+        session_q |= Q(session_id=re.compile(f"^{re.escape(session_id.lower())}(#|$)"))
+    return session_q
+
+
+def encode_session_cursor(session: ChatSession) -> str:
+    """Encode the (updated_at, id) position of a session as an opaque pagination cursor."""
+    raw = f"{session.updated_at.isoformat()}|{session.id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("utf-8")
+
+
+def decode_session_cursor(cursor: str) -> Q:
+    """Decode a pagination cursor into a filter matching the sessions that sort after it."""
+    try:
+        updated_at, session_id = base64.urlsafe_b64decode(cursor.encode("utf-8")).decode("utf-8").split("|")
+        updated_at = datetime.fromisoformat(updated_at)
+        session_id = ObjectId(session_id)
+    except (ValueError, InvalidId, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+    return Q(updated_at__lt=updated_at) | Q(updated_at=updated_at, id__lt=session_id)
+
+
+def sender_sessions_pipeline(user_id: str) -> List[dict]:
+    """Aggregation stages keeping only the sessions with at least one message from the given sender."""
+    return [
+        {
+            "$lookup": {
+                "from": ChatMessage._get_collection_name(),
+                "let": {"session_id": "$_id"},
+                "pipeline": [
+                    {"$match": {"sender": user_id, "$expr": {"$eq": ["$session", "$$session_id"]}}},
+                    {"$limit": 1},
+                    {"$project": {"_id": 1}},
+                ],
+                "as": "sender_messages",
+            }
+        },
+        {"$match": {"sender_messages.0": {"$exists": True}}},
+        {"$project": {"sender_messages": 0}},
+    ]
+
+
+def sender_sessions_page_pipeline(user_id: str, skip: int, limit: int) -> List[dict]:
+    """
+    Aggregation stages selecting one page of sessions with messages from the given sender, newest first,
+    with only the listed fields. Sorting before the $lookup lets the index supply the order, so the
+    lookup only runs until skip + limit matching sessions are found.
+    """
+    pipeline = [{"$sort": {"updated_at": -1, "_id": -1}}] + sender_sessions_pipeline(user_id)
+    if skip:
+        pipeline.append({"$skip": skip})
+    pipeline.append({"$limit": limit})
+    pipeline.append({"$project": {field: 1 for field in SESSION_LIST_FIELDS if field != "id"}})
+    return pipeline
+
+
+def list_sender_sessions(queryset, user_id: str, skip: int, limit: int) -> List[ChatSession]:
+    """Fetch a page of the queryset's sessions that contain messages from the given sender."""
+    pipeline = sender_sessions_page_pipeline(user_id, skip, limit)
+    return [ChatSession._from_son(doc, _auto_dereference=False) for doc in queryset.aggregate(pipeline)]
+
+
+def list_sender_sessions_with_total(
+    queryset, user_id: str, cursor: Optional[Q], skip: int, limit: int
+) -> Tuple[int, List[ChatSession]]:
+    """
+    Count and fetch a page of the queryset's sessions with messages from the given sender in one $facet
+    aggregation. Only the count needs the $lookup for every session; the page branch sorts first and
+    stops looking up once the page is full. The cursor only narrows the page, not the count.
+    """
+    page_pipeline = sender_sessions_page_pipeline(user_id, skip, limit)
+    if cursor:
+        page_pipeline.insert(0, {"$match": cursor.to_query(ChatSession)})
+
+    total_pipeline = sender_sessions_pipeline(user_id) + [{"$count": "total"}]
+    pipeline = [{"$facet": {"total": total_pipeline, "sessions": page_pipeline}}]
+    result = next(queryset.aggregate(pipeline))
+    total = result["total"][0]["total"] if result["total"] else 0
+    return total, [ChatSession._from_son(doc, _auto_dereference=False) for doc in result["sessions"]]
+
+
+def session_count_cache_key(query: dict, user_id: Optional[str] = None) -> str:
+    """Build the Redis key for the session count of a MongoDB filter query."""
+    normalized = json.dumps({"query": query, "user_id": user_id}, sort_keys=True, default=str).encode("utf-8")
+    return f"sess:count:{hashlib.blake2b(normalized, digest_size=16).hexdigest()}"
+
+
+async def get_cached_session_count(redis_client: Optional[Redis], cache_key: str) -> Optional[int]:
+    """Return the cached session count, or None on a miss or when Redis is unavailable."""
+    if not redis_client:
+        return None
+    try:
+        cached_total = await redis_client.get(cache_key)
+        return int(cached_total) if cached_total is not None else None
+    except RedisError as e:
+        logger.warning(f"Error reading cached session count: {e}")
+        return None
+
+
+async def cache_session_count(redis_client: Optional[Redis], cache_key: str, total: int):
+    """Cache a session count for a short while; failures only cost the next request a recount."""
+    if not redis_client:
+        return
+    try:
+        await redis_client.set(cache_key, total, ex=SESSION_COUNT_CACHE_TTL_SECONDS)
+    except RedisError as e:
+        logger.warning(f"Error caching session count: {e}")
+
+
+async def count_sessions(queryset, redis_client: Optional[Redis] = None, exact_count: bool = True) -> int:
+    """
+    Count the sessions matching the queryset, serving repeated filters from a short-lived Redis cache.
+    Without filters and exact_count disabled, the count comes from collection metadata instead.
+    """
+    query = queryset._query
+    if not query and not exact_count:
+        return await run_in_threadpool(ChatSession._get_collection().estimated_document_count)
+
+    cache_key = session_count_cache_key(query)
+    total = await get_cached_session_count(redis_client, cache_key)
+    if total is None:
+        total = await run_in_threadpool(queryset.count)
+        await cache_session_count(redis_client, cache_key, total)
+    return total
+
+
+async def fetch_sender_sessions(
+    queryset, user_id: str, cursor: Optional[Q], skip: int, limit: int, redis_client: Optional[Redis] = None
+) -> Tuple[int, List[ChatSession]]:
+    """
+    Fetch the total and a page of the queryset's sessions with messages from the given sender.
+    With a cached total only the page is queried, otherwise both come from a single $facet round-trip.
+    """
+    cache_key = session_count_cache_key(queryset._query, user_id)
+    total = await get_cached_session_count(redis_client, cache_key)
+    if total is not None:
+        page_queryset = queryset.filter(cursor) if cursor else queryset
+        sessions = await run_in_threadpool(list_sender_sessions, page_queryset, user_id, skip, limit)
+        return total, sessions
+
+    total, sessions = await run_in_threadpool(
+        list_sender_sessions_with_total, queryset, user_id, cursor, skip, limit
+    )
+    await cache_session_count(redis_client, cache_key, total)
+    return total, sessions
+
 
 @router.post("/sessions", response_model=dict)
 async def create_chat_session():
@@ -23,38 +224,73 @@ async def create_chat_session():
 
 
 @router.get("/sessions/{session_id}")
-async def get_chat_session(session_id: str):
-    try:
-        session = ChatSession.objects.get(id=session_id)
-        return {
-            "id": str(session.id),
-            "created_at": session.created_at,
-            "updated_at": session.updated_at,
-            "active": session.active,
-        }
-    except me.DoesNotExist:
+async def get_chat_session(session_id: str, redis_client: Optional[Redis] = Depends(get_redis)):
+    object_id = parse_object_id(session_id, "session_id")
+    # Key on the parsed ObjectId so it matches the key ChatSession.invalidate_cache() deletes
+    cache_key = ChatSession.cache_key(object_id)
+    if redis_client:
+        try:
+            cached_session = await redis_client.get(cache_key)
+            if cached_session is not None:
+                return orjson.loads(cached_session)
+        except RedisError as e:
+            logger.warning(f"Error reading cached chat session {session_id}: {e}")
+
+    # Read the few fields needed straight from the collection instead of hydrating a ChatSession
+    session = await run_in_threadpool(
+        ChatSession._get_collection().find_one,
+        {"_id": object_id},
+        {"created_at": 1, "updated_at": 1, "active": 1},
+    )
+    if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
 
+    response = {
+        "id": str(session["_id"]),
+        "created_at": session.get("created_at"),
+        "updated_at": session.get("updated_at"),
+        "active": session.get("active", True),
+    }
 
-@router.get("/sessions", response_model=ChatSessionListResponse)
+    # ChatSession.save() drops this entry, so the TTL only bounds writes made outside the model
+    if redis_client:
+        try:
+            await redis_client.set(cache_key, orjson.dumps(response), ex=SESSION_CACHE_TTL_SECONDS)
+        except RedisError as e:
+            logger.warning(f"Error caching chat session {session_id}: {e}")
+
+    return response
+
+
+@router.get("/sessions", response_model=ChatSessionListResponse, response_class=ORJSONResponse)
 async def list_chat_sessions(
     client_id: Annotated[Optional[str], Query(description="Filter by client ID")] = None,
     client_channel: Annotated[Optional[str], Query(description="Filter by client channel")] = None,
     user_id: Annotated[Optional[str], Query(description="Filter by user ID (sender)")] = None,
-    session_id: Annotated[Optional[str], Query(description="Filter by session ID (supports partial matching)")] = None,
+    session_id: Annotated[Optional[str], Query(description="Filter by session ID (supports prefix matching)")] = None,
     active: Annotated[Optional[bool], Query(description="Filter by active status")] = None,
     handover: Annotated[
         Optional[bool], Query(description="Filter sessions that were handed over to human agents")
     ] = None,
     start_date: Annotated[Optional[datetime], Query(description="Filter sessions created after this date")] = None,
     end_date: Annotated[Optional[datetime], Query(description="Filter sessions created before this date")] = None,
-    skip: Annotated[int, Query(description="Number of records to skip", ge=0)] = 0,
+    skip: Annotated[int, Query(description="Number of records to skip (ignored when after is given)", ge=0)] = 0,
+    after: Annotated[
+        Optional[str], Query(description="Cursor from a previous response's next_cursor to fetch the next page")
+    ] = None,
     limit: Annotated[int, Query(description="Maximum number of records to return", ge=1, le=100)] = 10,
+    exact_count: Annotated[
+        bool, Query(description="Set to false to allow an estimated total when no filters are given")
+    ] = True,
     api_key: str = Depends(verify_api_key),
+    redis_client: Optional[Redis] = Depends(get_redis),
 ):
     """
     List chat sessions with optional filtering by client_id, client_channel, user_id, active status,
     human handover status, and date range (start_date and end_date).
+
+    Prefer paginating with the after cursor over skip: the cursor seeks straight to the next page
+    through the (updated_at, _id) index, while skip makes MongoDB walk every skipped session.
     """
     try:
         # Validate date range if both dates provided
@@ -68,9 +304,9 @@ async def list_chat_sessions(
         
         # Standard filters
         if client_id:
-            query["client"] = ObjectId(client_id)
+            query["client"] = parse_object_id(client_id, "client_id")
         if client_channel:
-            query["client_channel"] = ObjectId(client_channel)
+            query["client_channel"] = parse_object_id(client_channel, "client_channel")
         if active is not None:
             query["active"] = active
         if start_date:
@@ -82,44 +318,61 @@ async def list_chat_sessions(
         if handover is not None:
             query["has_handover"] = handover
         
-        # Session ID filtering with partial matching
+        # Translate the filters once; the count and the page both derive from this queryset
+        queryset = ChatSession.objects(**query)
+
+        # Session ID filtering with anchored matching so the session_id index can be used
         if session_id:
-            # Directly use regex for session_id field
-            query["session_id__iregex"] = session_id
-        
-        # User ID filter requires a lookup to messages collection
+            queryset = queryset.filter(session_id_filter(session_id))
+
+        # Range-based pagination: only the page after the cursor is fetched, the count covers all matches
+        cursor = decode_session_cursor(after) if after else None
+        page_skip = 0 if after else skip
+
         if user_id:
-            # Get session IDs with messages from this user
-            unique_sessions = ChatMessage.objects.filter(sender=user_id).distinct("session")
-            if not unique_sessions:
-                return ChatSessionListResponse(sessions=[], total=0)
-            
-            query["id__in"] = [session.id for session in unique_sessions]
-        
-        # Get total count
-        total = ChatSession.objects.filter(**query).count()
-        
-        # Get paginated sessions
-        sessions = ChatSession.objects.filter(**query).order_by("-updated_at").skip(skip).limit(limit)
-        
-        # Format the response
-        session_list = []
-        for session in sessions:
-            session_list.append(
-                ChatSessionResponse(
-                    id=str(session.id),
-                    created_at=session.created_at,
-                    updated_at=session.updated_at,
-                    session_id=str(session.session_id) if session.session_id else "",
-                    active=session.active,
-                    client=str(session.client.id) if session.client else None,
-                    client_channel=str(session.client_channel.id) if session.client_channel else None,
-                    participants=session.participants,
-                    handover=session.has_handover
-                )
+            # User ID filter joins the messages collection, so count and page share one aggregation
+            total, sessions = await fetch_sender_sessions(
+                queryset, user_id, cursor, page_skip, limit, redis_client=redis_client
+            )
+        else:
+            page_queryset = queryset.filter(cursor) if cursor else queryset
+            page_queryset = page_queryset.only(*SESSION_LIST_FIELDS).no_dereference()
+
+            # MongoEngine is synchronous, so run the queries in the threadpool to keep the event loop free.
+            # Count and page are independent, so issue them concurrently.
+            total, sessions = await asyncio.gather(
+                count_sessions(queryset, redis_client=redis_client, exact_count=exact_count),
+                run_in_threadpool(
+                    list, page_queryset.order_by("-updated_at", "-id").skip(page_skip).limit(limit)
+                ),
+                return_exceptions=True,
+            )
+            if isinstance(sessions, BaseException):
+                raise sessions
+            if isinstance(total, BaseException):
+                # Don't drop the page because the count failed; fall back to what is known to exist
+                logger.error(f"Error counting chat sessions: {total}")
+                total = page_skip + len(sessions)
+
+        # Format the response; rows come straight from the database, so skip pydantic validation
+        session_list = [
+            ChatSessionResponse.model_construct(
+                id=str(session.id),
+                created_at=session.created_at,
+                updated_at=session.updated_at,
+                session_id=str(session.session_id) if session.session_id else "",
+                active=session.active,
+                client=session.get_reference_id("client"),
+                client_channel=session.get_reference_id("client_channel"),
+                participants=session.participants,
+                handover=session.has_handover,
             )
+            for session in sessions
+        ]
+
+        next_cursor = encode_session_cursor(sessions[-1]) if len(sessions) == limit else None
 
-        return ChatSessionListResponse(sessions=session_list, total=total)
+        return ChatSessionListResponse(sessions=session_list, total=total, next_cursor=next_cursor)
     except HTTPException:
         # Re-raise HTTP exceptions to preserve their status codes and messages
         raise
@@ -13,6 +13,7 @@ class Settings(BaseSettings):
     VERSION: str = "0.0.1"
 
     MONGODB_URI: str
+    MONGODB_MAX_POOL_SIZE: int = 100
     CELERY_BROKER_URL: Optional[str] = None
     CELERY_DEFAULT_QUEUE: Optional[str] = "chat_workflow"
     CELERY_EVENTS_QUEUE: Optional[str] = "events"
@@ -34,6 +35,10 @@ class Settings(BaseSettings):
     REDIS_PORT: Optional[int] = None
     REDIS_DB: Optional[int] = None
     REDIS_PASSWORD: Optional[str] = None
+    REDIS_MAX_CONNECTIONS: int = 100
+    # Keep these short: Redis only backs caches, so a slow Redis should fail fast and fall back to MongoDB
+    REDIS_SOCKET_TIMEOUT: float = 0.5
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = 0.5
 
     def get_redis_url(self) -> str:
         """Generate Redis URL from components if CELERY_BROKER_URL is not provided"""
@@ -4,7 +4,9 @@ from mongoengine import connect, disconnect
 
 
 def connect_to_db():
-    return connect(host=settings.MONGODB_URI, uuidRepresentation="standard")
+    return connect(
+        host=settings.MONGODB_URI, uuidRepresentation="standard", maxPoolSize=settings.MONGODB_MAX_POOL_SIZE
+    )
 
 
 def disconnect_from_db():
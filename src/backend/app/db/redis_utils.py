@@ -0,0 +1,36 @@
+from typing import Optional
+
+from redis import Redis as SyncRedis
+from redis.asyncio import Redis
+
+from app.core.config import settings
+
+_sync_redis_client: Optional[SyncRedis] = None
+
+
+def _redis_pool_options() -> dict:
+    return {
+        "max_connections": settings.REDIS_MAX_CONNECTIONS,
+        "socket_timeout": settings.REDIS_SOCKET_TIMEOUT,
+        "socket_connect_timeout": settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+    }
+
+
+def connect_to_redis() -> Optional[Redis]:
+    """Create the async Redis connection pool shared by the API, or None when Redis is not configured."""
+    if not settings.REDIS_HOST:
+        return None
+    return Redis.from_url(settings.get_redis_url(), **_redis_pool_options())
+
+
+async def disconnect_from_redis(redis_client: Optional[Redis]):
+    if redis_client:
+        await redis_client.aclose()
+
+
+def get_sync_redis_client() -> Optional[SyncRedis]:
+    """Return the shared blocking Redis client for sync code paths, or None when Redis is not configured."""
+    global _sync_redis_client
+    if _sync_redis_client is None and settings.REDIS_HOST:
+        _sync_redis_client = SyncRedis.from_url(settings.get_redis_url(), **_redis_pool_options())
+    return _sync_redis_client
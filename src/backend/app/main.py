@@ -5,6 +5,7 @@ import time
 from app.core.config import settings
 from app.api.v1.router import api_v1_router
 from app.db.mongodb_utils import connect_to_db, disconnect_from_db
+from app.db.redis_utils import connect_to_redis, disconnect_from_redis
 from app.services.metrics import init_app_info, MetricsService
 
 app = FastAPI(title=settings.PROJECT_NAME, version=settings.VERSION, openapi_url=f"/openapi.json")
@@ -39,12 +40,21 @@ async def startup_event():
     """Initialize application on startup"""
     # Connect to database
     connect_to_db()
+
+    # Share one Redis connection pool across requests
+    app.state.redis = connect_to_redis()
     
     # Initialize metrics
     init_app_info(settings.VERSION, settings.PROJECT_NAME)
 
 
+async def shutdown_event():
+    """Release connections on shutdown"""
+    disconnect_from_db()
+    await disconnect_from_redis(app.state.redis)
+
+
 app.add_event_handler("startup", startup_event)
-app.add_event_handler("shutdown", disconnect_from_db)
+app.add_event_handler("shutdown", shutdown_event)
 
 app.include_router(api_v1_router)
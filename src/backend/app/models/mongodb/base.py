@@ -14,3 +14,10 @@ class BaseDocument(Document):
         if "_id" in data:
             data["id"] = str(data["_id"])
         return data
+
+    def get_reference_id(self, field_name):
+        """Return the id stored in a reference field as a string, without dereferencing it."""
+        value = self._data.get(field_name)
+        if value is None:
+            return None
+        return str(getattr(value, "id", value))
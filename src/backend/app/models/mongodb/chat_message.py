@@ -62,7 +62,10 @@ class ChatMessage(BaseDocument):
     confidence_score = fields.FloatField(default=0.0)
 
     edit = fields.BooleanField(default=False)
-    meta = {"collection": "chat_messages", "indexes": ["created_at", "session", ("session", "created_at")]}
+    meta = {
+        "collection": "chat_messages",
+        "indexes": ["created_at", "session", ("session", "created_at"), ("sender", "session")],
+    }
 
     def is_suggestion_mode(self):
         return self.config and self.config.get("suggestion_mode", False)
@@ -1,6 +1,12 @@
 from mongoengine import fields
+from redis.exceptions import RedisError
+
+from app.db.redis_utils import get_sync_redis_client
+from app.utils.logger import get_logger
 from .base import BaseDocument
 
+logger = get_logger(__name__)
+
 
 class ChatSession(BaseDocument):
     session_id = fields.StringField(required=False)
@@ -11,4 +17,43 @@ class ChatSession(BaseDocument):
     has_handover = fields.BooleanField(default=False)
 
 
-    meta = {"collection": "chat_sessions", "indexes": ["created_at", "updated_at", "client", "client_channel"]}
+    meta = {
+        "collection": "chat_sessions",
+        "indexes": [
+            "created_at",
+            "client_channel",
+            "session_id",
+            ("-updated_at", "-id"),
+            # Session listing: equality filters first, then the updated_at sort/range (ESR)
+            {
+                "fields": ["client", "client_channel", "active", "has_handover", "-updated_at", "-id"],
+                "name": "sess_list_idx",
+            },
+        ],
+    }
+
+    @staticmethod
+    def cache_key(session_id) -> str:
+        """Redis key holding the cached get_chat_session response for a session."""
+        return f"sess:{session_id}"
+
+    def save(self, *args, **kwargs):
+        # A new session can't have a cached response yet, so only updates need invalidating
+        is_new = self.pk is None
+        session = super().save(*args, **kwargs)
+        if not is_new:
+            self.invalidate_cache()
+        return session
+
+    def invalidate_cache(self):
+        """
+        Drop the cached response for this session so readers see the latest write. This is a blocking
+        Redis round-trip, bounded by REDIS_SOCKET_TIMEOUT, on the caller's thread like the save itself.
+        """
+        redis_client = get_sync_redis_client()
+        if not redis_client or not self.id:
+            return
+        try:
+            redis_client.delete(self.cache_key(self.id))
+        except RedisError as e:
+            logger.warning(f"Error invalidating cached chat session {self.id}: {e}")
@@ -24,3 +24,4 @@ class ChatSessionListResponse(BaseModel):
 
     sessions: List[ChatSessionResponse]
     total: int
+    next_cursor: Optional[str] = Field(default=None, description="Cursor to pass as after to fetch the next page")
@@ -204,7 +204,8 @@ class ChatMessageService:
 
     @staticmethod
     def create_bulk_chat_messages(bulk_message_data: BulkChatMessageCreate) -> List[ChatMessageResponse]:
-        responses = []
+        """Create all messages of a bulk request in one insert, returned oldest first."""
+        chat_messages = []
         session = None
         client = ClientService.get_client(bulk_message_data.client_id)
         client_channel = ClientChannelService.get_channel_by_type(
@@ -239,7 +240,17 @@ class ChatMessageService:
                 category=message_data.category.value,
                 created_at=message_data.created_at or datetime.now(timezone.utc),
             )
-            chat_message.save()
-            responses.append(chat_message)
+            chat_message.validate()
+            chat_messages.append(chat_message)
 
-        return [ChatMessageResponse.from_chat_message(msg) for msg in responses]
+        # Single round-trip for the whole batch instead of one save() per message
+        if chat_messages:
+            result = ChatMessage._get_collection().insert_many(
+                [chat_message.to_mongo() for chat_message in chat_messages], ordered=False
+            )
+            for chat_message, inserted_id in zip(chat_messages, result.inserted_ids):
+                chat_message.id = inserted_id
+
+        responses = [ChatMessageResponse.from_chat_message(msg) for msg in chat_messages]
+        responses.sort(key=lambda response: response.created_at)
+        return responses